@@ -1,5 +1,6 @@
 import argparse
-from datetime import date, timedelta
+from datetime import timedelta
+from functools import lru_cache
 import os
 
 from recomp_components import RecompComponents
@@ -8,33 +9,37 @@ from source import GitSource, HgSource, Source
 PARAMS = {
     "frequency": timedelta(days=7),
     "dry_run": False,
+    "compact": False,
 }
 
 Milestones = list[RecompComponents]
 
 
 def get_next_date(milestones: Milestones):
-    next_date: date = None  # type: ignore
+    return min((milestone.get_next_date(PARAMS["frequency"])
+                for milestone in milestones), default=None)
 
-    for milestone in milestones:
-        candidate = milestone.get_next_date(PARAMS["frequency"])
-        if not next_date or candidate < next_date:
-            next_date = candidate
 
-    return next_date
+def is_switch_to_revision_required(milestones: Milestones, source: Source, date):
+    return any(not milestone.has_log_for_date(source, date)
+               for milestone in milestones)
 
 
-def is_switch_to_revision_required(milestones: Milestones, source: Source, date):
-    for milestone in milestones:
-        if not milestone.has_log_for_date(source, date):
-            return True
-    return False
+def pick_revisions(source: Source, next_date):
+    revisions: list[str] = []
+    while True:
+        revision = source.pick_next_revision(next_date)
+        if revisions and revision == revisions[-1]:
+            break
+        revisions.append(revision)
+        next_date += PARAMS["frequency"]
+    return revisions
 
 
 def update_milestones_for_revision(
         source: Source, milestones: Milestones, revision, use_current_revision):
+    rev_date = source.get_revision_date(revision, use_current_revision)
     for milestone in milestones:
-        rev_date = source.get_revision_date(revision, use_current_revision)
         if not use_current_revision:
             milestone_last_date = milestone.get_last_date()
             if milestone_last_date and rev_date <= milestone_last_date:
@@ -52,54 +57,58 @@ def update_milestones_for_revision(
             print(f"   - {milestone.name}: Not writing (dry run)")
         else:
             print(f"   - {milestone.name}: Writing")
-            milestone.save_progress()
             milestone.save_snapshot(snapshot)
 
 
+def save_milestones_progress(milestones: Milestones):
+    if PARAMS["dry_run"]:
+        return
+    for milestone in milestones:
+        milestone.save_progress(PARAMS["compact"])
+
+
 def main(use_current_revision, source: Source, milestones: Milestones):
     start_revision = source.get_current_revision()
     print(f"Your current revision is: {start_revision}")
 
     any_update_happened = False
 
-    if use_current_revision:
-        update_milestones_for_revision(
-            source, milestones, start_revision, True)
-        any_update_happened = True
-    else:
-        next_date = get_next_date(milestones)
-        print(f"The first date we need to collect data for is: {next_date}")
-        current_revision = None
-
-        while True:
-            next_revision = source.pick_next_revision(next_date)
-            if next_revision == current_revision:
-                break
-            next_rev_date = source.get_revision_date(next_revision, False)
-
-            if not next_date or next_rev_date < next_date:
-                print(
-                    f"But the latest available revision is {next_revision} ({next_rev_date})")
-                response = input("Do you want to collect date for it (Y/N):")
-                if response.lower() != "y":
-                    break
-
-            print(f"\nSelected revision: {next_revision} ({next_rev_date})")
-            if is_switch_to_revision_required(milestones, source, next_rev_date):
-                print(f" - Updating to revision")
-                source.switch_to_revision(next_revision)
-            current_revision = next_revision
-
-            print(f" - Collecting data")
-            any_update_happened = True
+    try:
+        if use_current_revision:
             update_milestones_for_revision(
-                source, milestones, current_revision, False)
-            next_date += PARAMS["frequency"]
-
-        end_revision = source.get_current_revision()
-        if start_revision != end_revision:
-            print(f"Switching back to start revision: {start_revision}.")
-            source.switch_to_revision(start_revision)
+                source, milestones, start_revision, True)
+            any_update_happened = True
+        else:
+            next_date = get_next_date(milestones)
+            print(f"The first date we need to collect data for is: {next_date}")
+            revisions = pick_revisions(source, next_date)
+            rev_dates = source.get_revision_dates(revisions, False)
+
+            for next_revision, next_rev_date in zip(revisions, rev_dates):
+                if not next_date or next_rev_date < next_date:
+                    print(
+                        f"But the latest available revision is {next_revision} ({next_rev_date})")
+                    response = input("Do you want to collect date for it (Y/N):")
+                    if response.lower() != "y":
+                        break
+
+                print(f"\nSelected revision: {next_revision} ({next_rev_date})")
+                if is_switch_to_revision_required(milestones, source, next_rev_date):
+                    print(f" - Updating to revision")
+                    source.switch_to_revision(next_revision)
+
+                print(f" - Collecting data")
+                any_update_happened = True
+                update_milestones_for_revision(
+                    source, milestones, next_revision, False)
+                next_date += PARAMS["frequency"]
+
+            end_revision = source.get_current_revision()
+            if start_revision != end_revision:
+                print(f"Switching back to start revision: {start_revision}.")
+                source.switch_to_revision(start_revision)
+    finally:
+        save_milestones_progress(milestones)
 
     if not any_update_happened:
         print("Could not find a revision for the next data update!")
@@ -107,9 +116,11 @@ def main(use_current_revision, source: Source, milestones: Milestones):
         print("DONE!")
 
 
+@lru_cache(maxsize=256)
 def is_file_writable(path, f):
-    if os.path.exists(os.path.join(path, f)):
-        return os.access(os.path.join(path, f), os.W_OK)
+    full_path = os.path.join(path, f)
+    if os.path.exists(full_path):
+        return os.access(full_path, os.W_OK)
     return os.access(path, os.W_OK)
 
 
@@ -122,12 +133,10 @@ def verify_milestone_paths(
         parser: argparse.ArgumentParser, gh_pages_data_path: str, milestone_name: str):
     data_path = os.path.join(gh_pages_data_path, milestone_name)
 
-    if not is_file_writable(data_path, "progress.json"):
-        parser.error(
-            f"{os.path.join(data_path, 'progress.json')} path is not writable!")
-    if not is_file_writable(data_path, "snapshot.json"):
-        parser.error(
-            f"{os.path.join(data_path, 'snapshot.json')} path is not writable!")
+    for f in ("progress.json", "snapshot.json"):
+        if not is_file_writable(data_path, f):
+            parser.error(
+                f"{os.path.join(data_path, f)} path is not writable!")
 
 
 def set_milestones(parser: argparse.ArgumentParser, args):
@@ -154,6 +163,9 @@ if __name__ == "__main__":
     parser.add_argument('--dry-run',
                         action='store_true',
                         help='If set, no data is written to files.')
+    parser.add_argument('--compact',
+                        action='store_true',
+                        help='If set, progress.json is written without indentation or key sorting.')
     parser.add_argument('--mc',
                         required=True,
                         metavar='../mozilla-unified',
@@ -177,5 +189,6 @@ if __name__ == "__main__":
         source = HgSource(args.mc)
 
     PARAMS["dry_run"] = args.dry_run
+    PARAMS["compact"] = args.compact
 
     main(args.use_current_revision, source, milestones)
@@ -1,36 +1,62 @@
 import os
 import json
+from bisect import bisect_left
 from datetime import date, timedelta
 
+try:
+    from orjson import dumps as dump_compact_json, loads
+except ImportError:
+    from json import loads
 
-def parse_date(input):
-    return date(*(int(s) for s in input.split("-")))
+    def dump_compact_json(value):
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+parse_date = date.fromisoformat
 
 
 class Milestone:
+    __slots__ = ("data_path", "progress_data", "dirty", "_dates")
+
     name: str = None  # type: ignore
     start_date: date = None  # type: ignore
 
     def __init__(self, data_path):
         self.data_path = os.path.join(data_path, self.name)
         self.progress_data = None
+        self.dirty = False
+        self._dates: list[date] = []
 
     def append_progress_entry(self, progress_entry):
         progress_data = self.get_progress_data()
-        print(progress_data)
-        if progress_data and progress_data[-1]["date"] == progress_entry["date"]:
-            progress_data[-1] = progress_entry
+        entry_date = parse_date(progress_entry["date"])
+        index = bisect_left(self._dates, entry_date)
+        if index < len(self._dates) and self._dates[index] == entry_date:
+            progress_data[index] = progress_entry
         else:
-            progress_data.append(progress_entry)
+            progress_data.insert(index, progress_entry)
+            self._dates.insert(index, entry_date)
+        self.dirty = True
 
     def get_progress_data(self):
         if self.progress_data is None:
             path = os.path.join(self.data_path, "progress.json")
 
             if os.path.exists(path):
-                self.progress_data = json.load(open(path))
+                with open(path, "rb") as f:
+                    self.progress_data = loads(f.read())
             else:
                 self.progress_data = []
+            self._dates = [parse_date(entry["date"])
+                           for entry in self.progress_data]
+            # Older runs could append out-of-order entries; keep both lists
+            # sorted so append_progress_entry can bisect them.
+            if any(a > b for a, b in zip(self._dates, self._dates[1:])):
+                order = sorted(range(len(self._dates)),
+                               key=self._dates.__getitem__)
+                self.progress_data = [self.progress_data[i] for i in order]
+                self._dates = [self._dates[i] for i in order]
 
         return self.progress_data
 
@@ -52,42 +78,47 @@ class Milestone:
 
         (entries, progress) = result
 
-        snapshot = {"date": str(date), "revision": revision, "data": entries}
-
+        date_str = str(date)
+        snapshot = {"date": date_str, "revision": revision, "data": entries}
         progress_entry = {
             "data": progress,
-            "date": snapshot["date"],
-            "revision": snapshot["revision"],
+            "date": date_str,
+            "revision": revision,
         }
 
         return (progress_entry, snapshot)
 
     def get_next_date(self, frequency: timedelta):
-        progress_data = self.get_progress_data()
-        if len(progress_data) > 0:
-            return parse_date(progress_data[-1]["date"]) + frequency
+        last_date = self.get_last_date()
+        if last_date is not None:
+            return last_date + frequency
         else:
             return self.start_date
 
     def get_last_date(self):
-        progress_data = self.get_progress_data()
-        if len(progress_data) > 0:
-            return parse_date(progress_data[-1]["date"])
-        else:
-            return None
+        self.get_progress_data()
+        return self._dates[-1] if self._dates else None
 
-    def save_progress(self):
-        json.dump(
-            self.progress_data,
-            open(os.path.join(self.data_path, "progress.json"), "w"),
-            indent=0,
-            separators=(",", ": "),
-            sort_keys=True,
-        )
+    def save_progress(self, compact=False):
+        if not self.dirty:
+            return
+
+        if compact:
+            payload = dump_compact_json(self.progress_data)
+        else:
+            payload = json.dumps(
+                self.progress_data,
+                indent=0,
+                separators=(",", ": "),
+                sort_keys=True,
+                ensure_ascii=False,
+            ).encode("utf-8")
+        path = os.path.join(self.data_path, "progress.json")
+        with open(path, "wb") as f:
+            f.write(payload)
+        self.dirty = False
 
     def save_snapshot(self, snapshot):
-        json.dump(
-            snapshot,
-            open(os.path.join(self.data_path, "snapshot.json"), "w"),
-            indent=0,
-        )
+        path = os.path.join(self.data_path, "snapshot.json")
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(snapshot, f, indent=0, ensure_ascii=False)
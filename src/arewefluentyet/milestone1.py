@@ -10,6 +10,8 @@ HTML_ENTITIES = ["quot", "amp", "nbsp", "lt", "gt"]
 
 
 class Milestone1(Milestone):
+    __slots__ = ()
+
     name = "M1"
     start_date = date(2019, 3, 24)
     main_file = "./browser/base/content/browser.xhtml"
@@ -28,7 +30,8 @@ class Milestone1(Milestone):
     def load_include(self, path, match=None):
         if match is not None:
             path = os.path.join(path, match[1])
-        raw_data = open(path).read()
+        with open(path) as f:
+            raw_data = f.read()
 
         new_dir = os.path.dirname(path)
 
@@ -6,6 +6,8 @@ from milestone import Milestone
 
 
 class Milestone2(Milestone):
+    __slots__ = ()
+
     name = "M2"
     start_date = date(2019, 8, 25)
     log_dir = "startup_log"
@@ -45,7 +47,8 @@ class Milestone2(Milestone):
             self.collect_log(source, date, revision)
 
         log_path = self.get_log_path(source, date)
-        raw_data = open(log_path).read()
+        with open(log_path) as f:
+            raw_data = f.read()
         (entries, progress) = self.extract_progress(raw_data)
         return (entries, progress)
 
@@ -8,6 +8,8 @@ from milestone import Milestone
 
 
 class Milestone3(Milestone):
+    __slots__ = ()
+
     name = "M3"
     start_date = date(2017, 11, 1)
 
@@ -9,6 +9,8 @@ from milestone import Milestone
 
 
 class RecompComponents(Milestone):
+    __slots__ = ()
+
     name = "RC"
     start_date = date(2024, 1, 1)
 
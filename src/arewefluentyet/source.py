@@ -4,16 +4,18 @@ from datetime import date
 
 
 def parse_date(input):
-    return date(*(int(s) for s in input.split("-")))
+    return date.fromisoformat(input.strip())
 
 
 class Source:
     current_revision: str | None
     path: str
+    revision_dates: dict[tuple[str, bool], date]
 
     def __init__(self, path: str):
         self.path = path
         self.current_revision = None
+        self.revision_dates = {}
 
     def get_current_revision(self) -> str:
         raise NotImplementedError
@@ -22,8 +24,28 @@ class Source:
         raise NotImplementedError
 
     def get_revision_date(self, rev: str, use_current_revision: bool) -> date:
+        key = (rev, use_current_revision)
+        if key not in self.revision_dates:
+            self.revision_dates[key] = self.query_revision_date(
+                rev, use_current_revision)
+        return self.revision_dates[key]
+
+    def get_revision_dates(self, revs: list[str], use_current_revision: bool) -> list[date]:
+        missing = list(dict.fromkeys(
+            rev for rev in revs
+            if (rev, use_current_revision) not in self.revision_dates))
+        if missing:
+            dates = self.query_revision_dates(missing, use_current_revision)
+            for rev, rev_date in zip(missing, dates, strict=True):
+                self.revision_dates[(rev, use_current_revision)] = rev_date
+        return [self.get_revision_date(rev, use_current_revision) for rev in revs]
+
+    def query_revision_date(self, rev: str, use_current_revision: bool) -> date:
         raise NotImplementedError
 
+    def query_revision_dates(self, revs: list[str], use_current_revision: bool) -> list[date]:
+        return [self.query_revision_date(rev, use_current_revision) for rev in revs]
+
     def switch_to_revision(self, rev: str) -> None:
         raise NotImplementedError
 
@@ -46,7 +68,7 @@ class GitSource(Source):
             self.current_revision = result.stdout.strip()
         return self.current_revision
 
-    def get_revision_date(self, rev, use_current_revision):
+    def query_revision_date(self, rev, use_current_revision):
         if use_current_revision:
             result = subprocess.run([
                 "git", "--no-pager", "-C", self.path,
@@ -81,7 +103,7 @@ class HgSource(Source):
         ], check=True, capture_output=True, encoding="ascii")
         return result.stdout
 
-    def get_revision_date(self, rev, use_current_revision):
+    def query_revision_date(self, rev, use_current_revision):
         if use_current_revision:
             result = subprocess.run([
                 "hg", "id", "--cwd", self.path,
@@ -95,6 +117,31 @@ class HgSource(Source):
 
         return parse_date(result.stdout)
 
+    def query_revision_dates(self, revs, use_current_revision):
+        if use_current_revision:
+            template = "{node} {date|shortdate}\n"
+        else:
+            template = "{node} {pushdate|shortdate}\n"
+
+        args = []
+        for rev in revs:
+            args += ["-r", rev]
+        result = subprocess.run([
+            "hg", "log", "--cwd", self.path, "-T", template, *args
+        ], check=True, capture_output=True, encoding="ascii")
+
+        dates = {}
+        for line in result.stdout.splitlines():
+            node, rev_date = line.split(" ")
+            dates[node] = parse_date(rev_date)
+
+        # Revisions not given as full nodes fall back to a lookup of their own.
+        return [
+            dates[rev] if rev in dates else self.query_revision_date(
+                rev, use_current_revision)
+            for rev in revs
+        ]
+
     def switch_to_revision(self, rev):
         if rev == self.current_revision:
             return